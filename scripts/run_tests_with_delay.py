@@ -5,6 +5,7 @@ This script runs pytest with additional delays between test classes
 to reduce the chance of hitting rate limits on external APIs.
 """
 
+import os
 import subprocess
 import sys
 import time
@@ -18,6 +19,8 @@ def run_tests_with_delay():
         "pytest",
         "-n",
         "2",  # Reduced parallelism
+        "--dist",
+        "loadgroup",  # Honor xdist_group marks so write/serial tests share one worker
         "-m",
         "not e2e",
         "--alluredir=allure-results",
@@ -27,6 +30,10 @@ def run_tests_with_delay():
         "--durations=10",  # Show slowest 10 tests
     ]
 
+    # Manually triggered CI runs also include tests marked slow or security
+    if os.getenv("GITHUB_EVENT_NAME") == "workflow_dispatch":
+        base_cmd.extend(["--run-slow", "--run-security"])
+
     # Add test files if they exist
     test_files = [
         "tests/test_users_crud.py",
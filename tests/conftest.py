@@ -15,51 +15,150 @@ Key Components:
 Fixtures:
 - base_url: Base URL for the API under test
 - api_key: API key for authentication
-- api_client: Configured API client with retry logic
+- api_client: Configured API client with retry logic and per-route schema validation
+- perf_api_client: API client without schema validation, for timed requests
 - users_endpoint: Users API endpoint URL
+- user_url: Precomputed single-user URL builder
+- bulk_post_results: Session-wide creation responses prefetched in one concurrent wave
 - login_endpoint: Login API endpoint URL
 - support_endpoint: Support/Resources API endpoint URL
-- valid_user_data: Valid user data for testing
+- valid_user_data: Read-only valid user data shared across the session
 - update_user_data: User data for update operations
 - invalid_credentials: Invalid credentials for negative testing
 - valid_credentials: Valid credentials for authentication testing
-- response_validator: Response validation helper
 - performance_timer: Performance measurement utility
+- vcr_config: Cassette settings for record/replay via pytest-recording
 
 Utilities:
 - assert_valid_schema: Validates response against JSON schema
 - verify_user_creation_response: Comprehensive user creation response validation
 - xfail_if_rate_limited: Handles rate limiting gracefully in tests
 - APIClient: Custom API client with retry logic and error handling
+- BulkPostResults: Body-keyed store of concurrently prefetched POST responses
 - PerformanceTimer: Performance measurement and threshold validation
 """
 
 from __future__ import annotations
 
 import json
+import logging
 import os
-from collections.abc import Mapping, MutableMapping
+import random
+import re
+import time
+import uuid
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, cast
+from types import MappingProxyType
+from typing import Any, Literal, cast
+from urllib.parse import urlsplit
 
 import allure
+import fastjsonschema
+import orjson
 import pytest
 import requests
-from jsonschema import ValidationError, validate
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
 
-from tests.test_constants import BULK_RETRY_CONFIG, RETRY_CONFIG, TIMEOUTS
+from tests.schemas.json_schemas import (
+    LIST_USERS_SCHEMA,
+    SINGLE_USER_SCHEMA,
+    UPDATE_USER_SCHEMA,
+)
+from tests.test_constants import (
+    BULK_RETRY_CONFIG,
+    CONNECTION_POOL,
+    HTTP_CACHE,
+    PERFORMANCE_THRESHOLDS,
+    RETRY_CONFIG,
+    TEST_USER_IDS,
+    TIMEOUTS,
+)
+
+
+logger = logging.getLogger(__name__)
 
 
 class SchemaValidationError(AssertionError):
-    """Wrap jsonschema's ValidationError so pytest shows assertion context."""
+    """Wrap fastjsonschema's validation errors so pytest shows assertion context."""
+
+
+SchemaValidator = Callable[[Any], Any]
+
+# Compiled validators keyed by id(schema). The schema itself is kept alongside the
+# validator so its id cannot be recycled while the cache entry is alive.
+_VALIDATOR_CACHE: dict[int, tuple[Mapping[str, Any], SchemaValidator]] = {}
+
+
+def _get_validator(schema: Mapping[str, Any]) -> SchemaValidator:
+    """Return a cached validator for ``schema``, compiling it on first use.
+
+    Schemas are module-level constants, so identity is a stable cache key.
+    fastjsonschema generates Python code specialized to each schema, so the
+    schema is only interpreted once per session. ``format`` keywords stay
+    annotations, as they were with jsonschema's default validator.
+    """
+    cached = _VALIDATOR_CACHE.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    validator = fastjsonschema.compile(dict(schema), use_formats=False)
+    _VALIDATOR_CACHE[id(schema)] = (schema, validator)
+    return validator
 
 
 def assert_valid_schema(payload: Any, schema: Mapping[str, Any]) -> None:
     """Assert that ``payload`` satisfies the provided JSON schema."""
     try:
-        validate(instance=payload, schema=schema)
-    except ValidationError as exc:
-        raise SchemaValidationError(str(exc)) from exc
+        _get_validator(schema)(payload)
+    except fastjsonschema.JsonSchemaValueException as exc:
+        raise SchemaValidationError(exc.message) from exc
+
+
+RouteSchema = tuple[str, re.Pattern[str], SchemaValidator]
+
+# Schema for each (method, path) whose 2xx responses are always well-formed.
+# Validators are compiled once at import. POST /users is not listed: the suite
+# deliberately sends invalid payloads that ReqRes echoes back with 201, and
+# verify_user_creation_response validates the well-formed cases itself.
+_SCHEMA_BY_ROUTE: tuple[RouteSchema, ...] = (
+    ("GET", re.compile(r"/users/?$"), _get_validator(LIST_USERS_SCHEMA)),
+    ("GET", re.compile(r"/users/[^/]+/?$"), _get_validator(SINGLE_USER_SCHEMA)),
+    ("PUT", re.compile(r"/users/[^/]+/?$"), _get_validator(UPDATE_USER_SCHEMA)),
+)
+
+
+def _validate_route_schema(
+    routes: Sequence[RouteSchema], method: str, response: requests.Response
+) -> None:
+    """Validate a 2xx response against the schema registered for its route.
+
+    Callers only pass 2xx responses; error bodies are left to the tests' own
+    status assertions and ``xfail_if_rate_limited``.
+
+    Args:
+        routes: ``(method, path pattern, validator)`` entries to match against
+        method: HTTP method of the request
+        response: Successful server response; unrouted responses are ignored
+    """
+    path = urlsplit(response.url).path
+    for route_method, pattern, validator in routes:
+        if route_method == method and pattern.search(path):
+            # Fail fast with a clear message instead of a JSON decode error
+            content_type = response.headers.get("Content-Type", "")
+            if not response.content or not content_type.startswith("application/json"):
+                raise SchemaValidationError(
+                    f"{method} {path}: expected a JSON body, got "
+                    f"{len(response.content)} bytes of {content_type or 'unknown type'}"
+                )
+            try:
+                validator(response.json())
+            except fastjsonschema.JsonSchemaValueException as exc:
+                raise SchemaValidationError(f"{method} {path}: {exc.message}") from exc
+            return
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
@@ -80,6 +179,36 @@ def pytest_addoption(parser: pytest.Parser) -> None:
         default=os.getenv("BASE_URL", "https://reqres.in"),
         help="Base URL for the API under test",
     )
+    parser.addoption(
+        "--http-cache",
+        action="store_true",
+        default=False,
+        help=(
+            "Cache GET/HEAD responses and POST /users responses on disk across runs "
+            "(requires requests-cache)"
+        ),
+    )
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Also run tests marked slow (skipped by default)",
+    )
+    parser.addoption(
+        "--run-security",
+        action="store_true",
+        default=False,
+        help="Also run non-smoke tests marked security (skipped by default)",
+    )
+    parser.addoption(
+        "--replay-cassettes",
+        action="store_true",
+        default=False,
+        help=(
+            "Replay tests marked replayable from tests/cassettes, recording any missing "
+            "cassette once (requires pytest-recording)"
+        ),
+    )
 
 
 def pytest_configure(config: pytest.Config) -> None:
@@ -98,6 +227,43 @@ def pytest_configure(config: pytest.Config) -> None:
     allure.dynamic.label("api_key", api_key[:10] + "..." if len(api_key) > 10 else api_key)
 
 
+# Markers whose tests only run when the matching option is given. Security tests that
+# are also marked smoke stay in the default run for fast feedback.
+_OPT_IN_MARKERS: dict[str, str] = {"slow": "--run-slow", "security": "--run-security"}
+
+
+# Runs before pytest-recording's own hooks so the added vcr marks are seen
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip opt-in (``slow``/``security``) tests unless their option is given.
+
+    With ``--replay-cassettes``, tests marked ``replayable`` also get a ``vcr``
+    mark; without it they always talk to the live API and nothing is recorded.
+    """
+    if config.getoption("--replay-cassettes"):
+        replay = pytest.mark.vcr(record_mode="once")
+        for item in items:
+            if "replayable" in item.keywords:
+                item.add_marker(replay)
+
+    skips = {
+        marker: pytest.mark.skip(reason=f"{marker} test; pass {option} to run it")
+        for marker, option in _OPT_IN_MARKERS.items()
+        if not config.getoption(option)
+    }
+    if not skips:
+        return
+
+    for item in items:
+        for marker, skip in skips.items():
+            if marker not in item.keywords:
+                continue
+            if marker == "security" and "smoke" in item.keywords:
+                continue
+            item.add_marker(skip)
+            break
+
+
 @pytest.fixture(scope="session")
 def base_url(pytestconfig: pytest.Config) -> str:
     """Base URL fixture for the API under test.
@@ -129,6 +295,39 @@ def api_key(pytestconfig: pytest.Config) -> str:
     return pytestconfig.getoption("--api-key") or os.getenv("REQRES_API_KEY") or "reqres-free-v1"
 
 
+def _orjson_default(obj: Any) -> Any:
+    """Serialize read-only mappings (e.g. MappingProxyType) that orjson rejects."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _encode_json(body: Any) -> bytes:
+    """Serialize a request body to JSON bytes with orjson."""
+    return orjson.dumps(body, default=_orjson_default)
+
+
+def _use_orjson_decoder(response: requests.Response) -> requests.Response:
+    """Make ``response.json()`` decode the raw body with orjson instead of stdlib json.
+
+    Calls that pass decoder kwargs (``object_hook`` and friends) fall back to the
+    stock implementation, and decode failures are raised as
+    ``requests.exceptions.JSONDecodeError`` just like ``Response.json()`` does.
+    """
+    stdlib_json = response.json
+
+    def _json(**kwargs: Any) -> Any:
+        if kwargs:
+            return stdlib_json(**kwargs)
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:
+            raise requests.exceptions.JSONDecodeError(exc.msg, exc.doc, exc.pos) from exc
+
+    response.json = _json  # type: ignore[method-assign]
+    return response
+
+
 class APIClient:
     """Lightweight wrapper over requests.Session with convenience helpers.
 
@@ -137,6 +336,7 @@ class APIClient:
     - Configurable retry behavior (can be disabled per request)
     - Jitter to prevent thundering herd problems
     - Comprehensive logging of retry attempts
+    - JSON bodies encoded and responses decoded with orjson
 
     Rate Limiting Solution:
     Instead of accepting 429 responses as valid test outcomes, this client automatically
@@ -149,7 +349,11 @@ class APIClient:
     - Rate limiting tests: Use api_client_no_retry fixture or retry=False parameter
     """
 
-    def __init__(self, session: requests.Session) -> None:
+    def __init__(
+        self,
+        session: requests.Session,
+        route_schemas: Sequence[RouteSchema] = (),
+    ) -> None:
         """Represents a class that is initialized with a requests session.
 
         Manages a given session and can be used to perform HTTP operations or other
@@ -158,8 +362,13 @@ class APIClient:
 
         Args:
             session: An instance of `requests.Session` to be used for making HTTP requests.
+            route_schemas: Optional ``(method, path pattern, validator)`` entries; every
+                2xx response on a matching route is validated before it is returned.
         """
         self._session = session
+        self._route_schemas = tuple(route_schemas)
+        # Worker pool shared by every post_many() call; started lazily, see close()
+        self._executor: ThreadPoolExecutor | None = None
 
     def request(
         self,
@@ -181,6 +390,7 @@ class APIClient:
         - Configurable retry logic (enabled by default)
         - Exponential backoff with jitter for 429 and selected 5xx responses
         - A more aggressive backoff profile for bulk operations
+        - orjson encoding of ``json`` bodies and decoding of ``response.json()``
 
         Args:
             method: HTTP method to use (e.g., "GET", "POST").
@@ -194,11 +404,11 @@ class APIClient:
             bulk_mode: If True, use BULK_RETRY_CONFIG; otherwise use RETRY_CONFIG.
 
         Returns:
-            requests.Response: The final response from the server. If a retryable
-            status code is encountered and max retries are exhausted, the last
-            response is returned. When retries are exhausted without success, the
-            response will include header 'X-Retry-Exhausted: 1' to allow callers to
-            distinguish this case.
+            requests.Response: The final response from the server; its ``json()``
+            decodes the body with orjson. If a retryable status code is encountered
+            and max retries are exhausted, the last response is returned. When
+            retries are exhausted without success, the response will include header
+            'X-Retry-Exhausted: 1' to allow callers to distinguish this case.
 
         Raises:
             requests.exceptions.RequestException: If a network/connection error occurs
@@ -214,10 +424,17 @@ class APIClient:
         if timeout is None:
             timeout = TIMEOUTS["DEFAULT"]
 
-        # Implement retry logic for rate limiting and server errors
-        import random
-        import time
+        # Pre-encode JSON bodies with orjson rather than letting requests use stdlib json
+        if json is not None and data is None:
+            data = _encode_json(json)
+            json = None
+            merged_headers: MutableMapping[str, str] = CaseInsensitiveDict(
+                {"Content-Type": "application/json"}
+            )
+            merged_headers.update(headers or {})
+            headers = merged_headers
 
+        # Implement retry logic for rate limiting and server errors
         # Use bulk retry config for bulk operations, regular config otherwise
         config = BULK_RETRY_CONFIG if bulk_mode else RETRY_CONFIG
 
@@ -240,21 +457,29 @@ class APIClient:
 
                 # If successful or non-retryable error, return response
                 if response.status_code not in retry_status_codes:
+                    response = _use_orjson_decoder(response)
+                    # Only 2xx bodies are validated; 4xx (including a 429 that got past
+                    # retry=False) stay with the caller's xfail/status checks
+                    if self._route_schemas and 200 <= response.status_code < 300:
+                        _validate_route_schema(self._route_schemas, method.upper(), response)
                     return response
 
                 # If this is the last attempt, return the response (don't retry)
                 if attempt == max_retries:
                     # Ensure callers can detect exhaustion distinctly via a flag
                     response.headers.setdefault("X-Retry-Exhausted", "1")
-                    return response
+                    return _use_orjson_decoder(response)
 
                 # Calculate backoff time with jitter
                 backoff_time = min(backoff_factor * (2**attempt), max_backoff)
                 jitter = random.uniform(0, 0.1 * backoff_time)  # Add up to 10% jitter
                 wait_time = backoff_time + jitter
 
-                print(
-                    f"Rate limited (attempt {attempt + 1}/{max_retries + 1}), waiting {wait_time:.2f}s before retry..."
+                logger.warning(
+                    "Rate limited (attempt %d/%d), waiting %.2fs before retry...",
+                    attempt + 1,
+                    max_retries + 1,
+                    wait_time,
                 )
                 time.sleep(wait_time)
 
@@ -270,8 +495,12 @@ class APIClient:
                 jitter = random.uniform(0, 0.1 * backoff_time)
                 wait_time = backoff_time + jitter
 
-                print(
-                    f"Request failed (attempt {attempt + 1}/{max_retries + 1}): {e}, waiting {wait_time:.2f}s before retry..."
+                logger.warning(
+                    "Request failed (attempt %d/%d): %s, waiting %.2fs before retry...",
+                    attempt + 1,
+                    max_retries + 1,
+                    e,
+                    wait_time,
                 )
                 time.sleep(wait_time)
 
@@ -342,6 +571,75 @@ class APIClient:
             bulk_mode=bulk_mode,
         )
 
+    def post_many(
+        self,
+        url: str,
+        payloads: Sequence[Any],
+        *,
+        headers: MutableMapping[str, str] | None = None,
+        timeout: float | None = None,
+        retry: bool = True,
+        bulk_mode: bool = True,
+        encoded: bool = False,
+    ) -> list[requests.Response]:
+        """Send several independent POST requests concurrently.
+
+        Each payload is sent through post(), so the usual retry/backoff rules
+        apply per request. Requests are dispatched from a thread pool over the
+        shared session, turning N sequential round-trips into a few concurrent
+        waves. The pool is created once per client and reused by later calls.
+
+        Args:
+            url: Target URL for every request.
+            payloads: JSON bodies to send, one request per item.
+            headers: Optional HTTP headers applied to every request.
+            timeout: Request timeout in seconds.
+            retry: Whether to use retry/backoff logic.
+            bulk_mode: Use bulk retry configuration (enabled by default).
+            encoded: Payloads are already-encoded JSON bytes; send them unchanged as
+                the request body with an application/json content type.
+
+        Returns:
+            list[requests.Response]: Responses in the same order as ``payloads``.
+        """
+        if not payloads:
+            return []
+
+        if encoded:
+            json_headers: MutableMapping[str, str] = CaseInsensitiveDict(
+                {"Content-Type": "application/json"}
+            )
+            json_headers.update(headers or {})
+            headers = json_headers
+
+        def _post(payload: Any) -> requests.Response:
+            return self.post(
+                url,
+                json=None if encoded else payload,
+                data=payload if encoded else None,
+                headers=headers,
+                timeout=timeout,
+                retry=retry,
+                bulk_mode=bulk_mode,
+            )
+
+        return list(self._get_executor().map(_post, payloads))
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the client's shared worker pool, starting it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=PERFORMANCE_THRESHOLDS["CONCURRENT_REQUESTS"],
+                thread_name_prefix="api-client",
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Shut down the shared worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
     def put(
         self,
         url: str,
@@ -443,36 +741,169 @@ class APIClient:
         )
 
 
+class BulkPostResults:
+    """Session-wide store of POST responses keyed by canonical request body.
+
+    ``prefetch`` sends every payload not seen yet in one concurrent wave through
+    ``APIClient.post_many``; lookups then read from memory. A payload that was not
+    prefetched is posted on first lookup and stored like the others.
+    """
+
+    def __init__(self, api_client: APIClient, url: str) -> None:
+        """Bind the store to a client and target URL.
+
+        Args:
+            api_client: Client used to send the POST requests.
+            url: Endpoint every payload is posted to.
+        """
+        self._api_client = api_client
+        self._url = url
+        self._responses: dict[bytes, requests.Response] = {}
+
+    @staticmethod
+    def _key(payload: Mapping[str, Any]) -> bytes:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=_orjson_default)
+
+    def prefetch(self, payloads: Iterable[Mapping[str, Any]]) -> None:
+        """POST every payload that has no stored response yet, concurrently.
+
+        Args:
+            payloads: JSON bodies to send; duplicates are sent once.
+        """
+        # The canonical key is itself the encoded body, so each payload is serialized once
+        keys = dict.fromkeys(map(self._key, payloads))
+        pending = [key for key in keys if key not in self._responses]
+
+        responses = self._api_client.post_many(self._url, pending, bulk_mode=True, encoded=True)
+        self._responses.update(zip(pending, responses, strict=True))
+
+    def __getitem__(self, payload: Mapping[str, Any]) -> requests.Response:
+        """Return the response for ``payload``, posting it first if needed."""
+        key = self._key(payload)
+        response = self._responses.get(key)
+        if response is None:
+            response = self._api_client.post(
+                self._url,
+                data=key,
+                headers={"Content-Type": "application/json"},
+                bulk_mode=True,
+            )
+            self._responses[key] = response
+        return response
+
+
+def _is_cacheable_response(response: requests.Response) -> bool:
+    """Limit POST caching to the user-creation endpoint.
+
+    Args:
+        response: Response about to be stored by requests-cache
+
+    Returns:
+        True for non-POST responses and for POSTs to the users collection
+    """
+    request = response.request
+    if request.method != "POST":
+        return True
+    return urlsplit(request.url or "").path.rstrip("/").endswith(
+        HTTP_CACHE["CACHEABLE_POST_PATH"]
+    )
+
+
+def _build_session(pytestconfig: pytest.Config) -> requests.Session:
+    """Create a plain session, or a disk-backed cached one when --http-cache is set."""
+    if not pytestconfig.getoption("--http-cache"):
+        return requests.Session()
+
+    try:
+        import requests_cache
+    except ImportError as exc:
+        raise pytest.UsageError(
+            "--http-cache requires requests-cache (pip install requests-cache)"
+        ) from exc
+
+    # Reads are cached, plus user-creation POSTs: their cache key includes the
+    # normalized JSON body, so each deterministic invalid/edge payload is served
+    # from disk on reruns. Auth endpoints, PUT/PATCH and DELETE always hit the API.
+    return requests_cache.CachedSession(
+        cache_name=HTTP_CACHE["CACHE_NAME"],
+        backend="sqlite",
+        expire_after=HTTP_CACHE["EXPIRE_AFTER"],
+        allowable_methods=("GET", "HEAD", "POST"),
+        filter_fn=_is_cacheable_response,
+    )
+
+
 @pytest.fixture(scope="session")
-def client(api_key: str) -> requests.Session:
+def client(api_key: str, pytestconfig: pytest.Config) -> Iterator[requests.Session]:
     """Create a configured requests.Session for API calls.
 
+    The session is shared by every test in the run and mounts a pooled
+    HTTPAdapter so connections are kept alive between requests instead of
+    paying a new TCP/TLS handshake per test. Retries are left to APIClient,
+    so the adapter itself does not retry.
+
+    With ``--http-cache`` the session is a requests-cache CachedSession that
+    stores GET/HEAD responses, and POST /users responses keyed on the request
+    body, in a local SQLite file, so reruns skip the network for them. Response-time
+    tests are not meaningful in that mode.
+
     Args:
         api_key: API key to include in default headers.
+        pytestconfig: Pytest config, used to read the ``--http-cache`` option.
 
-    Returns:
-        Configured requests.Session with default headers.
+    Yields:
+        Configured requests.Session with default headers; closed at session end.
     """
-    session = requests.Session()
+    session = _build_session(pytestconfig)
     session.headers.update({"x-api-key": api_key, "Accept": "application/json"})
-    return session
+
+    # Retries and backoff belong to APIClient; the transport must never retry on its own.
+    # Retry(0, read=False) matches requests' own default, so read errors still surface as
+    # ReadTimeout/ConnectionError rather than being wrapped in MaxRetryError.
+    adapter = HTTPAdapter(
+        pool_connections=CONNECTION_POOL["POOL_CONNECTIONS"],
+        pool_maxsize=CONNECTION_POOL["POOL_MAXSIZE"],
+        max_retries=Retry(0, read=False),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    yield session
+    session.close()
 
 
 @pytest.fixture(scope="session")
-def api_client(client: requests.Session) -> APIClient:
+def api_client(client: requests.Session) -> Iterator[APIClient]:
     """Provide an APIClient with retry logic enabled by default.
 
+    Successful responses on the user routes in ``_SCHEMA_BY_ROUTE`` are
+    schema-validated automatically, so tests do not need to name the schema.
+
     Args:
         client: Shared requests.Session fixture.
 
-    Returns:
+    Yields:
         APIClient instance using the provided session.
     """
-    return APIClient(client)
+    api_client = APIClient(client, route_schemas=_SCHEMA_BY_ROUTE)
+    yield api_client
+    api_client.close()
 
 
 @pytest.fixture(scope="session")
-def api_client_no_retry(client: requests.Session) -> APIClient:
+def perf_api_client(client: requests.Session) -> Iterator[APIClient]:
+    """API client without route schema validation, for response-time tests.
+
+    Validation would otherwise run inside the timed region and be counted as
+    server latency.
+    """
+    api_client = APIClient(client)
+    yield api_client
+    api_client.close()
+
+
+@pytest.fixture(scope="session")
+def api_client_no_retry(client: requests.Session) -> Iterator[APIClient]:
     """API client with retries disabled - useful for testing rate limiting behavior."""
     api_client = APIClient(client)
     # Override methods to default retry=False
@@ -483,7 +914,8 @@ def api_client_no_retry(client: requests.Session) -> APIClient:
         return original_request(*args, **kwargs)
 
     api_client.request = request_no_retry
-    return api_client
+    yield api_client
+    api_client.close()
 
 
 @pytest.fixture(scope="session")
@@ -499,6 +931,49 @@ def users_endpoint(base_url: str) -> str:
     return f"{base_url}/api/users"
 
 
+@pytest.fixture(scope="session")
+def user_url(users_endpoint: str) -> Callable[[int | str], str]:
+    """Single-user URL builder backed by a precomputed table.
+
+    URLs for every TEST_USER_IDS value are built once per session; other IDs
+    are formatted on first use and then reused.
+
+    Args:
+        users_endpoint: Fully-qualified /api/users endpoint.
+
+    Returns:
+        Callable mapping a user ID to its /api/users/{id} URL.
+    """
+    url_table: dict[int | str, str] = {
+        user_id: f"{users_endpoint}/{user_id}" for user_id in TEST_USER_IDS.values()
+    }
+
+    def _user_url(user_id: int | str) -> str:
+        url = url_table.get(user_id)
+        if url is None:
+            url = url_table[user_id] = f"{users_endpoint}/{user_id}"
+        return url
+
+    return _user_url
+
+
+@pytest.fixture(scope="session")
+def bulk_post_results(api_client: APIClient, users_endpoint: str) -> BulkPostResults:
+    """Session-wide creation responses, keyed by request body.
+
+    Tests prefetch all of their deterministic payloads in one concurrent wave and
+    then look responses up by payload, so the test bodies do no network I/O.
+
+    Args:
+        api_client: Shared API client.
+        users_endpoint: Fully-qualified /api/users endpoint.
+
+    Returns:
+        BulkPostResults bound to the users endpoint.
+    """
+    return BulkPostResults(api_client, users_endpoint)
+
+
 @pytest.fixture(scope="session")
 def support_endpoint(base_url: str) -> str:
     """Support/resources endpoint base URL.
@@ -574,38 +1049,80 @@ def test_data() -> dict[str, Any]:
         return json.load(f)
 
 
-def verify_user_creation_response(response, expected_status_code, expected_data, schema):
+CreationVerifier = Callable[[requests.Response, int, Mapping[str, Any]], dict[str, Any]]
+
+# Specialized creation verifiers keyed by (compiled schema validator, echoed field names)
+_CREATION_VERIFIERS: dict[tuple[SchemaValidator, tuple[str, ...]], CreationVerifier] = {}
+
+
+def _get_creation_verifier(
+    schema: Mapping[str, Any], expected_keys: tuple[str, ...]
+) -> CreationVerifier:
+    """Return a verifier specialized to ``schema`` and the echoed ``expected_keys``.
+
+    The schema and the field list are bound into a closure once, so every creation
+    test sharing the same schema reuses the same verifier. The cache is keyed on the
+    compiled validator object, which is unique per schema and kept alive here.
+    """
+    cache_key = (_get_validator(schema), expected_keys)
+    verifier = _CREATION_VERIFIERS.get(cache_key)
+    if verifier is not None:
+        return verifier
+
+    def _verify(
+        response: requests.Response, expected_status_code: int, expected_data: Mapping[str, Any]
+    ) -> dict[str, Any]:
+        # Verify status code
+        assert response.status_code == expected_status_code
+
+        # Verify response schema
+        payload = response.json()
+        assert_valid_schema(payload, schema)
+
+        # Verify user data matches what was submitted
+        for key in expected_keys:
+            assert payload[key] == expected_data[key]
+
+        # Verify system-generated fields exist
+        assert "id" in payload
+        assert "createdAt" in payload
+
+        return payload
+
+    _CREATION_VERIFIERS[cache_key] = _verify
+    return _verify
+
+
+def verify_user_creation_response(
+    response: requests.Response,
+    expected_status_code: int,
+    expected_data: Mapping[str, Any],
+    schema: Mapping[str, Any],
+) -> dict[str, Any]:
     """Verify user creation response.
 
     Args:
         response: API response to verify
         expected_status_code: Expected HTTP status code
-        expected_data: Dictionary containing the user data that was submitted
+        expected_data: Mapping containing the user data that was submitted
         schema: Schema to validate the response against
-    """
-    # Verify status code
-    assert response.status_code == expected_status_code
 
-    # Verify response schema
-    payload = response.json()
-    assert_valid_schema(payload, schema)
-
-    # Verify user data matches what was submitted
-    assert payload["name"] == expected_data["name"]
-    assert payload["job"] == expected_data["job"]
-
-    # Verify system-generated fields exist
-    assert "id" in payload
-    assert "createdAt" in payload
+    Returns:
+        The decoded response payload.
+    """
+    verifier = _get_creation_verifier(schema, ("name", "job"))
+    return verifier(response, expected_status_code, expected_data)
 
-    return payload
 
+@pytest.fixture(scope="session")
+def valid_user_data(test_data) -> Mapping[str, str]:
+    """Get a deterministic, read-only valid user data for creation tests.
 
-@pytest.fixture
-def valid_user_data(test_data) -> dict[str, str]:
-    """Get a deterministic valid user data for creation tests."""
+    Built once per session and shared by every test; copy it with ``dict()``
+    before mutating.
+    """
     # Use first valid user for consistency across test runs
-    return test_data["valid_users"][0].copy()
+    return MappingProxyType(dict(test_data["valid_users"][0]))
 
 
 @pytest.fixture
@@ -673,9 +1190,6 @@ def user_data_factory(test_data):
 @pytest.fixture
 def isolated_user_data():
     """Create unique user data for each test to ensure test isolation."""
-    import time
-    import uuid
-
     # Create unique identifiers to prevent test interference
     timestamp = int(time.time() * 1000)  # milliseconds
     unique_id = str(uuid.uuid4())[:8]
@@ -686,9 +1200,6 @@ def isolated_user_data():
 @pytest.fixture
 def isolated_update_data():
     """Create unique update data for each test to ensure test isolation."""
-    import time
-    import uuid
-
     # Create unique identifiers to prevent test interference
     timestamp = int(time.time() * 1000)  # milliseconds
     unique_id = str(uuid.uuid4())[:8]
@@ -696,33 +1207,29 @@ def isolated_update_data():
     return {"name": f"Updated User {unique_id}", "job": f"Updated Job {timestamp}"}
 
 
-@pytest.fixture
-def response_validator():
-    """Factory fixture for common response validations."""
-
-    def _validate_response(response, expected_status=None, schema=None, max_time=None):
-        """Validate common response patterns."""
-        # Status code validation
-        if expected_status:
-            assert response.status_code == expected_status
+@pytest.fixture(scope="module")
+def vcr_config() -> dict[str, Any]:
+    """VCR.py settings used by pytest-recording for tests marked ``vcr``.
 
-        # Schema validation
-        if schema:
-            payload = response.json()
-            assert_valid_schema(payload, schema)
-            return payload
-
-        return response
+    Only tests marked ``replayable`` get that mark, and only under
+    ``--replay-cassettes``.
 
-    return _validate_response
+    The API key is scrubbed from recorded cassettes, and requests are matched on
+    their body too, so POSTs to the same URL with different payloads replay the
+    right response. Cassettes are stored as JSON so Unicode bodies stay readable
+    in diffs.
+    """
+    return {
+        "serializer": "json",
+        "filter_headers": ["x-api-key", "authorization"],
+        "match_on": ["method", "scheme", "host", "port", "path", "query", "body"],
+        "decode_compressed_response": True,
+    }
 
 
 @pytest.fixture
 def performance_timer():
     """Fixture for measuring and asserting response times."""
-    import time
-
-    from tests.test_constants import PERFORMANCE_THRESHOLDS
 
     class PerformanceTimer:
         def __init__(self):
@@ -737,8 +1244,6 @@ def performance_timer():
             self.end_time = time.time()
             return self
 
-        from typing import Literal
-
         # Define the valid threshold key types
         threshold_key_type = Literal[
             "RESPONSE_TIME_FAST",
@@ -925,13 +1430,12 @@ _last_test_class = None
 def pytest_runtest_setup(item):
     """Add delays between test classes to prevent rate limiting."""
     global _last_test_class
-    import time
 
     test_class = item.cls.__name__ if item.cls else "NoClass"
 
     # Add delay between different test classes
     if _last_test_class and _last_test_class != test_class:
-        print("\nRate limiting protection: Waiting 2s between test classes...")
+        logger.info("Rate limiting protection: Waiting 2s between test classes...")
         time.sleep(2.0)
 
     _last_test_class = test_class
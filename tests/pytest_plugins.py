@@ -4,8 +4,11 @@ This module provides pytest hooks to add delays between test classes
 to prevent overwhelming external APIs with too many concurrent requests.
 """
 
+import logging
 import time
 
+logger = logging.getLogger(__name__)
+
 
 class RateLimitProtection:
     """Plugin to add delays between test classes to prevent rate limiting."""
@@ -34,8 +37,8 @@ class RateLimitProtection:
         test_class = item.cls.__name__ if item.cls else "NoClass"
 
         if self.last_test_class and self.last_test_class != test_class:
-            print(
-                f"\nRate limiting protection: Waiting {self.class_delay}s between test classes..."
+            logger.info(
+                "Rate limiting protection: Waiting %ss between test classes...", self.class_delay
             )
             time.sleep(self.class_delay)
 
@@ -23,7 +23,9 @@ Notes:
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from enum import IntEnum
+from types import MappingProxyType
 
 # Type definitions for better IDE support
 from typing import Final, Literal, TypedDict
@@ -78,6 +80,32 @@ class TimeoutConfig(TypedDict):
     SLOW: float
 
 
+class PoolConfig(TypedDict):
+    """HTTP connection pool sizing for the shared requests.Session.
+
+    Attributes:
+        POOL_CONNECTIONS (int): Number of per-host connection pools to cache.
+        POOL_MAXSIZE (int): Maximum number of keep-alive connections per pool.
+    """
+
+    POOL_CONNECTIONS: int
+    POOL_MAXSIZE: int
+
+
+class HttpCacheConfig(TypedDict):
+    """Settings for the optional on-disk HTTP cache (``--http-cache``).
+
+    Attributes:
+        CACHE_NAME (str): Base path of the SQLite cache file.
+        EXPIRE_AFTER (int): Seconds before a cached response is refetched.
+        CACHEABLE_POST_PATH (str): Path suffix whose POST responses may be cached.
+    """
+
+    CACHE_NAME: str
+    EXPIRE_AFTER: int
+    CACHEABLE_POST_PATH: str
+
+
 class RetryConfig(TypedDict):
     """Retry settings for handling transient failures.
 
@@ -166,6 +194,12 @@ PERFORMANCE_THRESHOLDS: Final[PerformanceConfig] = {
 }
 """Concrete performance thresholds as a mapping compatible with TypedDict."""
 
+# Read-only template for payload tables built at import time
+BASE_USER_PAYLOAD: Final[Mapping[str, str]] = MappingProxyType(
+    {"name": "John Doe", "job": "Software Engineer"}
+)
+"""Valid user payload (mirrors valid_users[0] in test_users.json); copy before mutating."""
+
 # Test data patterns for Unicode and special character testing
 TEST_PATTERNS: Final[dict[str, str]] = {
     "SPECIAL_CHARS": "José María O'Connor-Smith",  # Test handling of accents and special chars
@@ -182,6 +216,21 @@ TIMEOUTS: Final[TimeoutConfig] = {
 }
 """Default timeouts in seconds for different test categories."""
 
+# Connection pool sizing for the session-wide HTTP client
+CONNECTION_POOL: Final[PoolConfig] = {
+    "POOL_CONNECTIONS": 20,
+    "POOL_MAXSIZE": 20,
+}
+"""Keep-alive pool sizing so all tests share warm TCP/TLS connections."""
+
+# On-disk cache for idempotent reads, enabled with --http-cache
+HTTP_CACHE: Final[HttpCacheConfig] = {
+    "CACHE_NAME": ".pytest_http_cache",
+    "EXPIRE_AFTER": 3600,
+    "CACHEABLE_POST_PATH": "/users",
+}
+"""Local GET/HEAD and user-creation POST cache used to speed up repeated local runs."""
+
 
 # Retry configuration for rate limiting
 class RetrySettings: